@@ -31,11 +31,81 @@ try:
         spectral_transform,
     )
 
-    # Make commonly used functions available at package level
+    _PUBLIC = (
+        "backend_info",
+        "cfftb",
+        "cfftf",
+        "cosqb",
+        "cosqf",
+        "cost",
+        "genbun",
+        "genbun_batch",
+        "hstcrt",
+        "hstcsp",
+        "hstcyl",
+        "hstplr",
+        "hstssp",
+        "hw3crt",
+        "hwscrt",
+        "hwscsp",
+        "hwscyl",
+        "hwsplr",
+        "hwsssp",
+        "pois3d",
+        "poistg",
+        "rfftb",
+        "rfftf",
+        "sinqb",
+        "sinqf",
+        "sint",
+        "sor_biharmonic2d",
+        "sor_general2d",
+        "sor_general3d",
+        "sor_standard1d",
+        "sor_standard2d",
+        "sor_standard3d",
+    )
+
+    # Make the compiled solvers available at package level
     # These will be available as PyFishPack.genbun, etc.
-    from .fishpack import *
+    # A stale backend missing any of these raises ImportError and takes
+    # the warning fallback below; keep this list in sync with _PUBLIC.
+    from .fishpack import (
+        backend_info,
+        cfftb,
+        cfftf,
+        cosqb,
+        cosqf,
+        cost,
+        genbun,
+        genbun_batch,
+        hstcrt,
+        hstcsp,
+        hstcyl,
+        hstplr,
+        hstssp,
+        hw3crt,
+        hwscrt,
+        hwscsp,
+        hwscyl,
+        hwsplr,
+        hwsssp,
+        pois3d,
+        poistg,
+        rfftb,
+        rfftf,
+        sinqb,
+        sinqf,
+        sint,
+        sor_biharmonic2d,
+        sor_general2d,
+        sor_general3d,
+        sor_standard1d,
+        sor_standard2d,
+        sor_standard3d,
+    )
 
-    __all__ = [name for name in dir(fishpack) if not name.startswith('_')]
+    __all__ = list(_PUBLIC)
     __all__.extend([
         "invert_3DOcean",
         "invert_BrethertonHaidvogel",
@@ -59,14 +129,35 @@ try:
 
 except ImportError as e:
     import warnings
-    print(f"Warning: Could not import fishpack extension: {e}")
-    print("Make sure the extension is compiled correctly.")
     warnings.warn(f"Could not import fishpack extension: {e}. "
                   f"Make sure the extension is compiled correctly.",
-                  ImportWarning)
+                  RuntimeWarning,
+                  stacklevel=2)
 
-    # Fallback - define empty __all__
+    # Fallback - drop any names bound before the failure, define empty
+    # __all__ and remember why the backend is missing
+    for _name in globals().get("_PUBLIC", ()):
+        globals().pop(_name, None)
     __all__ = []
+    _BACKEND_IMPORT_ERROR = e
+
+
+def __getattr__(name):
+    """Resolve names not re-exported above lazily from the compiled backend."""
+    backend = globals().get("fishpack")
+    if name.startswith("_"):
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    error = globals().get("_BACKEND_IMPORT_ERROR")
+    if backend is None or error is not None:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r} because the compiled "
+            f"fishpack extension failed to import: {error}") from error
+    try:
+        return getattr(backend, name)
+    except AttributeError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}") from None
+
 
 # Package metadata
 __author__ = "Qianye Su"
@@ -3105,16 +3105,24 @@ def _solve_constant_2d_batched(
             raise_on_error=raise_on_error,
         )
     else:
-        for index in np.ndindex(arr.shape[:-2]):
-            result[index] = _solve_constant_2d(
-                arr[index],
-                dy=dy,
-                dx=dx,
-                bcs=bcs,
-                coefficients=coefficients,
-                helmholtz=helmholtz,
-                raise_on_error=raise_on_error,
-            )
+        nperod, mperod, a, b, c, scale = _genbun_system(
+            m,
+            dy=dy,
+            dx=dx,
+            bcs=bcs,
+            coefficients=coefficients,
+            helmholtz=helmholtz,
+        )
+        stack = np.moveaxis(arr.reshape((-1, m, n)), 0, -1)
+        rhs = np.multiply(stack, scale, dtype=np.float64, order="F")
+        # rhs is already a fresh F-ordered float64 stack; solve it in place.
+        solution, ierrors = fishpack.genbun_batch(
+            nperod, n, mperod, m, a, b, c, rhs, overwrite_y=True
+        )
+        failed = np.flatnonzero(ierrors)
+        if raise_on_error and failed.size:
+            raise RuntimeError(f"Fishpack genbun failed with ierror={int(ierrors[failed[0]])}")
+        result[...] = np.moveaxis(solution, -1, 0).reshape(arr.shape)
     return result
 
 
@@ -3166,6 +3174,31 @@ def _solve_constant_2d(
     helmholtz: float,
     raise_on_error: bool,
 ) -> np.ndarray:
+    m, n = force.shape
+    nperod, mperod, a, b, c, scale = _genbun_system(
+        m,
+        dy=dy,
+        dx=dx,
+        bcs=bcs,
+        coefficients=coefficients,
+        helmholtz=helmholtz,
+    )
+    rhs = np.multiply(force, scale, dtype=np.float64, order="F")
+    solution, ierror = fishpack.genbun(nperod, n, mperod, m, a, b, c, rhs)
+    if raise_on_error and ierror != 0:
+        raise RuntimeError(f"Fishpack genbun failed with ierror={ierror}")
+    return np.asarray(solution)
+
+
+def _genbun_system(
+    m: int,
+    *,
+    dy: float,
+    dx: float,
+    bcs: tuple[str, str],
+    coefficients: tuple[float, float],
+    helmholtz: float,
+) -> tuple[int, int, np.ndarray, np.ndarray, np.ndarray, float]:
     alpha_y, alpha_x = (float(item) for item in coefficients)
     if not np.isfinite(alpha_y) or not np.isfinite(alpha_x):
         raise ValueError("2D coefficients must be finite")
@@ -3176,7 +3209,6 @@ def _solve_constant_2d(
             "Fishpack genbun path requires elliptic 2D coefficients with the same sign"
         )
 
-    m, n = force.shape
     ratio = (alpha_y / alpha_x) * (dx / dy) ** 2
     a = np.full(m, ratio, dtype=np.float64)
     b = np.full(m, -2.0 * ratio + float(helmholtz) * dx * dx / alpha_x, dtype=np.float64)
@@ -3190,11 +3222,7 @@ def _solve_constant_2d(
         c[-1] = 0.0
 
     nperod = 0 if bcs[1] == "periodic" else 1
-    rhs = np.array(force, dtype=np.float64, order="F", copy=True) * (dx * dx / alpha_x)
-    solution, ierror = fishpack.genbun(nperod, n, mperod, m, a, b, c, rhs)
-    if raise_on_error and ierror != 0:
-        raise RuntimeError(f"Fishpack genbun failed with ierror={ierror}")
-    return np.asarray(solution)
+    return nperod, mperod, a, b, c, dx * dx / alpha_x
 
 
 def _solve_constant_3d_batched(
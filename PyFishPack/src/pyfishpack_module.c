@@ -156,6 +156,28 @@ static PyArrayObject *as_fortran_double_copy(PyObject *obj, int ndim, const char
     return arr;
 }
 
+static PyArrayObject *as_fortran_double_in(PyObject *obj, int ndim, const char *name)
+{
+    /* Read-only inputs: reuse Fortran-ordered float64 arrays without copying. */
+    PyArray_Descr *descr = PyArray_DescrFromType(NPY_DOUBLE);
+    PyArrayObject *arr = (PyArrayObject *)PyArray_FromAny(
+        obj,
+        descr,
+        ndim,
+        ndim,
+        NPY_ARRAY_F_CONTIGUOUS | NPY_ARRAY_ALIGNED,
+        NULL);
+    if (arr == NULL) {
+        return NULL;
+    }
+    if (!PyArray_IS_F_CONTIGUOUS(arr)) {
+        PyErr_Format(PyExc_ValueError, "%s could not be converted to a Fortran-contiguous float64 array", name);
+        Py_DECREF(arr);
+        return NULL;
+    }
+    return arr;
+}
+
 static int require_len(PyArrayObject *arr, npy_intp expected, const char *name)
 {
     if (PyArray_DIM(arr, 0) < expected) {
@@ -332,6 +354,88 @@ fail:
     return NULL;
 }
 
+static PyObject *fishpack_genbun_batch(PyObject *self, PyObject *args, PyObject *kwds)
+{
+    static char *kwlist[] = {"nperod", "n", "mperod", "m", "a", "b", "c", "y", "overwrite_y", NULL};
+    int nperod, n, mperod, m;
+    int idimy, overwrite_y = 0;
+    npy_intp nbatch, k, stride;
+    PyObject *a_obj, *b_obj, *c_obj, *y_obj;
+    PyArrayObject *a = NULL, *b = NULL, *c = NULL, *y = NULL, *ierror = NULL;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "iiiiOOOO|p:genbun_batch", kwlist,
+                                     &nperod, &n, &mperod, &m,
+                                     &a_obj, &b_obj, &c_obj, &y_obj, &overwrite_y)) {
+        return NULL;
+    }
+
+    a = as_double_1d(a_obj, "a");
+    b = as_double_1d(b_obj, "b");
+    c = as_double_1d(c_obj, "c");
+    /* overwrite_y lets callers that already built an owned, writeable,
+     * Fortran-ordered float64 stack hand it over instead of paying for a
+     * second full copy; anything else still goes through the copy path. */
+    if (overwrite_y && PyArray_Check(y_obj) && PyArray_NDIM((PyArrayObject *)y_obj) == 3 &&
+        PyArray_TYPE((PyArrayObject *)y_obj) == NPY_DOUBLE &&
+        PyArray_ISNOTSWAPPED((PyArrayObject *)y_obj) &&
+        PyArray_CHKFLAGS((PyArrayObject *)y_obj, NPY_ARRAY_FARRAY | NPY_ARRAY_OWNDATA)) {
+        Py_INCREF(y_obj);
+        y = (PyArrayObject *)y_obj;
+    } else {
+        y = as_fortran_double_copy(y_obj, 3, "y");
+    }
+    if (a == NULL || b == NULL || c == NULL || y == NULL) {
+        goto fail;
+    }
+
+    idimy = (int)PyArray_DIM(y, 0);
+    if (!require_len(a, m, "a") || !require_len(b, m, "b") || !require_len(c, m, "c")) {
+        goto fail;
+    }
+    if (PyArray_DIM(y, 1) != n || idimy < m) {
+        PyErr_Format(PyExc_ValueError,
+                     "y must have shape (idimy, n, nbatch) with idimy >= m; got (%zd, %zd, %zd), m=%d, n=%d",
+                     (Py_ssize_t)PyArray_DIM(y, 0), (Py_ssize_t)PyArray_DIM(y, 1),
+                     (Py_ssize_t)PyArray_DIM(y, 2), m, n);
+        goto fail;
+    }
+
+    nbatch = PyArray_DIM(y, 2);
+    ierror = (PyArrayObject *)PyArray_ZEROS(1, &nbatch, NPY_INT, 0);
+    if (ierror == NULL) {
+        goto fail;
+    }
+
+    /* Each right-hand side is one contiguous (idimy, n) column-major slab of y.
+     * GENBUN allocates its workspace per call, so the slabs are solved
+     * independently across OpenMP threads (OMP_NUM_THREADS) when enabled. */
+    stride = (npy_intp)idimy * n;
+    Py_BEGIN_ALLOW_THREADS
+#ifdef _OPENMP
+#pragma omp parallel for schedule(static)
+#endif
+    for (k = 0; k < nbatch; ++k) {
+        pyfp_genbun(nperod, n, mperod, m, idimy,
+                    PyArray_DATA(a), PyArray_DATA(b), PyArray_DATA(c),
+                    (double *)PyArray_DATA(y) + k * stride,
+                    (int *)PyArray_GETPTR1(ierror, k));
+    }
+    Py_END_ALLOW_THREADS
+
+    Py_DECREF(a);
+    Py_DECREF(b);
+    Py_DECREF(c);
+    return Py_BuildValue("NN", (PyObject *)y, (PyObject *)ierror);
+
+fail:
+    Py_XDECREF(a);
+    Py_XDECREF(b);
+    Py_XDECREF(c);
+    Py_XDECREF(y);
+    Py_XDECREF(ierror);
+    return NULL;
+}
+
 static PyObject *fishpack_poistg(PyObject *self, PyObject *args)
 {
     int nperod, n, mperod, m;
@@ -567,12 +671,12 @@ static PyObject *fishpack_hw3crt(PyObject *self, PyObject *args)
         return NULL;
     }
 
-    bdxs = as_fortran_double_copy(bdxs_obj, 2, "bdxs");
-    bdxf = as_fortran_double_copy(bdxf_obj, 2, "bdxf");
-    bdys = as_fortran_double_copy(bdys_obj, 2, "bdys");
-    bdyf = as_fortran_double_copy(bdyf_obj, 2, "bdyf");
-    bdzs = as_fortran_double_copy(bdzs_obj, 2, "bdzs");
-    bdzf = as_fortran_double_copy(bdzf_obj, 2, "bdzf");
+    bdxs = as_fortran_double_in(bdxs_obj, 2, "bdxs");
+    bdxf = as_fortran_double_in(bdxf_obj, 2, "bdxf");
+    bdys = as_fortran_double_in(bdys_obj, 2, "bdys");
+    bdyf = as_fortran_double_in(bdyf_obj, 2, "bdyf");
+    bdzs = as_fortran_double_in(bdzs_obj, 2, "bdzs");
+    bdzf = as_fortran_double_in(bdzf_obj, 2, "bdzf");
     f = as_fortran_double_copy(f_obj, 3, "f");
     if (bdxs == NULL || bdxf == NULL || bdys == NULL || bdyf == NULL ||
         bdzs == NULL || bdzf == NULL || f == NULL) {
@@ -658,9 +762,9 @@ static PyObject *fishpack_sor_standard1d(PyObject *self, PyObject *args)
     }
 
     s = as_fortran_double_copy(s_obj, 1, "s");
-    a = as_fortran_double_copy(a_obj, 1, "a");
-    b = as_fortran_double_copy(b_obj, 1, "b");
-    f = as_fortran_double_copy(f_obj, 1, "f");
+    a = as_fortran_double_in(a_obj, 1, "a");
+    b = as_fortran_double_in(b_obj, 1, "b");
+    f = as_fortran_double_in(f_obj, 1, "f");
     if (s == NULL || a == NULL || b == NULL || f == NULL) {
         goto fail;
     }
@@ -714,10 +818,10 @@ static PyObject *fishpack_sor_standard2d(PyObject *self, PyObject *args)
     }
 
     s = as_fortran_double_copy(s_obj, 2, "s");
-    a = as_fortran_double_copy(a_obj, 2, "a");
-    b = as_fortran_double_copy(b_obj, 2, "b");
-    c = as_fortran_double_copy(c_obj, 2, "c");
-    f = as_fortran_double_copy(f_obj, 2, "f");
+    a = as_fortran_double_in(a_obj, 2, "a");
+    b = as_fortran_double_in(b_obj, 2, "b");
+    c = as_fortran_double_in(c_obj, 2, "c");
+    f = as_fortran_double_in(f_obj, 2, "f");
     if (s == NULL || a == NULL || b == NULL || c == NULL || f == NULL) {
         goto fail;
     }
@@ -777,10 +881,10 @@ static PyObject *fishpack_sor_standard3d(PyObject *self, PyObject *args)
     }
 
     s = as_fortran_double_copy(s_obj, 3, "s");
-    a = as_fortran_double_copy(a_obj, 3, "a");
-    b = as_fortran_double_copy(b_obj, 3, "b");
-    c = as_fortran_double_copy(c_obj, 3, "c");
-    f = as_fortran_double_copy(f_obj, 3, "f");
+    a = as_fortran_double_in(a_obj, 3, "a");
+    b = as_fortran_double_in(b_obj, 3, "b");
+    c = as_fortran_double_in(c_obj, 3, "c");
+    f = as_fortran_double_in(f_obj, 3, "f");
     if (s == NULL || a == NULL || b == NULL || c == NULL || f == NULL) {
         goto fail;
     }
@@ -842,13 +946,13 @@ static PyObject *fishpack_sor_general2d(PyObject *self, PyObject *args)
     }
 
     s = as_fortran_double_copy(s_obj, 2, "s");
-    a = as_fortran_double_copy(a_obj, 2, "a");
-    b = as_fortran_double_copy(b_obj, 2, "b");
-    c = as_fortran_double_copy(c_obj, 2, "c");
-    d = as_fortran_double_copy(d_obj, 2, "d");
-    e = as_fortran_double_copy(e_obj, 2, "e");
-    fcoef = as_fortran_double_copy(fcoef_obj, 2, "fcoef");
-    g = as_fortran_double_copy(g_obj, 2, "g");
+    a = as_fortran_double_in(a_obj, 2, "a");
+    b = as_fortran_double_in(b_obj, 2, "b");
+    c = as_fortran_double_in(c_obj, 2, "c");
+    d = as_fortran_double_in(d_obj, 2, "d");
+    e = as_fortran_double_in(e_obj, 2, "e");
+    fcoef = as_fortran_double_in(fcoef_obj, 2, "fcoef");
+    g = as_fortran_double_in(g_obj, 2, "g");
     if (s == NULL || a == NULL || b == NULL || c == NULL ||
         d == NULL || e == NULL || fcoef == NULL || g == NULL) {
         goto fail;
@@ -920,14 +1024,14 @@ static PyObject *fishpack_sor_general3d(PyObject *self, PyObject *args)
     }
 
     s = as_fortran_double_copy(s_obj, 3, "s");
-    a = as_fortran_double_copy(a_obj, 3, "a");
-    b = as_fortran_double_copy(b_obj, 3, "b");
-    c = as_fortran_double_copy(c_obj, 3, "c");
-    d = as_fortran_double_copy(d_obj, 3, "d");
-    e = as_fortran_double_copy(e_obj, 3, "e");
-    fcoef = as_fortran_double_copy(fcoef_obj, 3, "fcoef");
-    g = as_fortran_double_copy(g_obj, 3, "g");
-    h = as_fortran_double_copy(h_obj, 3, "h");
+    a = as_fortran_double_in(a_obj, 3, "a");
+    b = as_fortran_double_in(b_obj, 3, "b");
+    c = as_fortran_double_in(c_obj, 3, "c");
+    d = as_fortran_double_in(d_obj, 3, "d");
+    e = as_fortran_double_in(e_obj, 3, "e");
+    fcoef = as_fortran_double_in(fcoef_obj, 3, "fcoef");
+    g = as_fortran_double_in(g_obj, 3, "g");
+    h = as_fortran_double_in(h_obj, 3, "h");
     if (s == NULL || a == NULL || b == NULL || c == NULL || d == NULL ||
         e == NULL || fcoef == NULL || g == NULL || h == NULL) {
         goto fail;
@@ -1005,16 +1109,16 @@ static PyObject *fishpack_sor_biharmonic2d(PyObject *self, PyObject *args)
     }
 
     s = as_fortran_double_copy(s_obj, 2, "s");
-    a = as_fortran_double_copy(a_obj, 2, "a");
-    b = as_fortran_double_copy(b_obj, 2, "b");
-    c = as_fortran_double_copy(c_obj, 2, "c");
-    d = as_fortran_double_copy(d_obj, 2, "d");
-    e = as_fortran_double_copy(e_obj, 2, "e");
-    fcoef = as_fortran_double_copy(fcoef_obj, 2, "fcoef");
-    g = as_fortran_double_copy(g_obj, 2, "g");
-    h = as_fortran_double_copy(h_obj, 2, "h");
-    icoef = as_fortran_double_copy(icoef_obj, 2, "icoef");
-    jcoef = as_fortran_double_copy(jcoef_obj, 2, "jcoef");
+    a = as_fortran_double_in(a_obj, 2, "a");
+    b = as_fortran_double_in(b_obj, 2, "b");
+    c = as_fortran_double_in(c_obj, 2, "c");
+    d = as_fortran_double_in(d_obj, 2, "d");
+    e = as_fortran_double_in(e_obj, 2, "e");
+    fcoef = as_fortran_double_in(fcoef_obj, 2, "fcoef");
+    g = as_fortran_double_in(g_obj, 2, "g");
+    h = as_fortran_double_in(h_obj, 2, "h");
+    icoef = as_fortran_double_in(icoef_obj, 2, "icoef");
+    jcoef = as_fortran_double_in(jcoef_obj, 2, "jcoef");
     if (s == NULL || a == NULL || b == NULL || c == NULL || d == NULL ||
         e == NULL || fcoef == NULL || g == NULL || h == NULL ||
         icoef == NULL || jcoef == NULL) {
@@ -1226,6 +1330,9 @@ static PyMethodDef fishpack_methods[] = {
      "Return details about the compiled PyFishPack backend."},
     {"genbun", (PyCFunction)fishpack_genbun, METH_VARARGS,
      "Solve a centered-grid separable elliptic system using the modern Fortran GENBUN backend."},
+    {"genbun_batch", (PyCFunction)(void (*)(void))fishpack_genbun_batch, METH_VARARGS | METH_KEYWORDS,
+     "Solve a stack of GENBUN systems sharing the same coefficients; y has shape (idimy, n, nbatch). "
+     "With overwrite_y=True an owned, writeable, Fortran-ordered float64 y is solved in place."},
     {"poistg", (PyCFunction)fishpack_poistg, METH_VARARGS,
      "Solve a staggered-grid separable elliptic system using the modern Fortran POISTG backend."},
     {"pois3d", (PyCFunction)fishpack_pois3d, METH_VARARGS,
@@ -12,6 +12,7 @@ from __future__ import annotations
 import argparse
 import json
 import math
+import os
 import statistics
 import sys
 import time
@@ -58,6 +59,7 @@ def check_backend_methods(pyfishpack: Any) -> dict[str, Any]:
     expected = {
         "backend_info",
         "genbun",
+        "genbun_batch",
         "poistg",
         "pois3d",
         "hwscrt",
@@ -186,6 +188,63 @@ def check_sor_general2d_backend(pyfishpack: Any) -> dict[str, Any]:
     return checked
 
 
+def _readonly_fortran(values: np.ndarray) -> np.ndarray:
+    arr = np.array(values, dtype=np.float64, order="F", copy=True)
+    arr.setflags(write=False)
+    return arr
+
+
+def check_sor_readonly_inputs(pyfishpack: Any) -> dict[str, Any]:
+    fishpack = pyfishpack.fishpack
+    rng = np.random.default_rng(2024)
+    settings = (1.7, -9.99e8, 200, 1e-12)
+    cases = {
+        "sor_standard1d": (
+            fishpack.sor_standard1d,
+            (40,),
+            4,
+            (1.0, "fixed"),
+        ),
+        "sor_standard2d": (
+            fishpack.sor_standard2d,
+            (30, 32),
+            5,
+            (1.0, 1.0, "fixed", "fixed"),
+        ),
+        "sor_standard3d": (
+            fishpack.sor_standard3d,
+            (10, 11, 12),
+            5,
+            (1.0, 1.0, 1.0, "fixed", "fixed", "fixed"),
+        ),
+        "sor_general2d": (
+            fishpack.sor_general2d,
+            (30, 32),
+            8,
+            (1.0, 1.0, "fixed", "fixed"),
+        ),
+    }
+    checked: dict[str, Any] = {}
+    for name, (solver, shape, count, tail) in cases.items():
+        # s starts at zero, f is random, coefficients stay positive and elliptic.
+        inputs = [1.0 + 0.1 * rng.random(shape) for _ in range(count)]
+        inputs[0] = np.zeros(shape)
+        inputs[-1] = rng.standard_normal(shape)
+        readonly = [_readonly_fortran(item) for item in inputs]
+        snapshots = [item.copy(order="F") for item in readonly]
+
+        expected = solver(*inputs, *tail, *settings)
+        actual = solver(*readonly, *tail, *settings)
+
+        for index, (item, snapshot) in enumerate(zip(readonly, snapshots)):
+            if not np.array_equal(item, snapshot):
+                raise AssertionError(f"{name} modified read-only input {index}")
+        if not np.array_equal(actual[0], expected[0]):
+            raise AssertionError(f"{name} result depends on input memory layout")
+        checked[name] = {"inputs": count, "shape": list(shape)}
+    return checked
+
+
 def check_sor_standard3d_backend(pyfishpack: Any) -> dict[str, Any]:
     nz, ny, nx = 12, 13, 14
     dz, dy, dx = 1.2, 0.9, 1.1
@@ -441,6 +500,44 @@ def check_genbun_example(pyfishpack: Any) -> dict[str, Any]:
     return _assert_close("genbun UCAR example error", error, 0.964062912725572e-2, 5e-12)
 
 
+def check_genbun_batch_backend(pyfishpack: Any) -> dict[str, Any]:
+    fishpack = pyfishpack.fishpack
+    # Enough right-hand sides that every OpenMP thread solves several slabs.
+    m, n = 129, 128
+    nbatch = max(16, 4 * (os.cpu_count() or 1))
+    rng = np.random.default_rng(1234)
+    a = np.ones(m, dtype=np.float64)
+    b = np.full(m, -4.0, dtype=np.float64)
+    c = np.ones(m, dtype=np.float64)
+    a[0] = 0.0
+    c[-1] = 0.0
+    rhs = np.asfortranarray(rng.standard_normal((m, n, nbatch)))
+
+    solutions, ierrors = fishpack.genbun_batch(0, n, 1, m, a, b, c, rhs)
+    if np.any(ierrors != 0):
+        raise AssertionError(f"genbun_batch returned ierror={ierrors.tolist()}")
+    max_delta = 0.0
+    for k in range(nbatch):
+        single, ierror = fishpack.genbun(0, n, 1, m, a, b, c, rhs[:, :, k])
+        if ierror != 0:
+            raise AssertionError(f"genbun returned ierror={ierror}")
+        max_delta = max(max_delta, float(np.max(np.abs(solutions[:, :, k] - single))))
+    checked = _assert_close("genbun_batch vs genbun", max_delta, 0.0, 0.0)
+
+    owned = rhs.copy(order="F")
+    inplace, ierrors = fishpack.genbun_batch(0, n, 1, m, a, b, c, owned, overwrite_y=True)
+    if inplace is not owned or np.any(ierrors != 0):
+        raise AssertionError("genbun_batch(overwrite_y=True) did not solve the owned stack in place")
+    if not np.array_equal(inplace, solutions):
+        raise AssertionError("genbun_batch(overwrite_y=True) differs from the copying path")
+    view = rhs[:, :, ::2]
+    strided, _ = fishpack.genbun_batch(0, n, 1, m, a, b, c, view, overwrite_y=True)
+    if strided is view or not np.array_equal(view, rhs[:, :, ::2]):
+        raise AssertionError("genbun_batch(overwrite_y=True) modified a non-contiguous view")
+    checked.update({"nbatch": nbatch, "shape": [m, n], "overwrite_y": True})
+    return checked
+
+
 def check_poistg_example(pyfishpack: Any) -> dict[str, Any]:
     fishpack = pyfishpack.fishpack
     m, n = 40, 20
@@ -2157,11 +2254,13 @@ def main() -> int:
             "sor_standard1d_residual": check_sor_standard1d_backend(pyfishpack),
             "sor_standard2d_residual": check_sor_standard2d_backend(pyfishpack),
             "sor_standard3d_manufactured": check_sor_standard3d_backend(pyfishpack),
+            "sor_readonly_fortran_inputs": check_sor_readonly_inputs(pyfishpack),
             "sor_general2d_manufactured": check_sor_general2d_backend(pyfishpack),
             "sor_general3d_manufactured": check_sor_general3d_backend(pyfishpack),
             "sor_biharmonic2d_manufactured": check_sor_biharmonic2d_backend(pyfishpack),
             "fftpack_transform_roundtrip": check_fftpack_transforms(pyfishpack),
             "genbun_ucar_example": check_genbun_example(pyfishpack),
+            "genbun_batch_matches_single": check_genbun_batch_backend(pyfishpack),
             "poistg_ucar_example": check_poistg_example(pyfishpack),
             "pois3d_ucar_example": check_pois3d_example(pyfishpack),
             "hwscrt_ucar_example": check_hwscrt_example(pyfishpack),